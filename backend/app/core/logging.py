@@ -5,19 +5,27 @@ This module provides centralized logging setup with context management,
 structured output, and integration with cloud logging services.
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from .config import settings
 
+try:
+    # C-implemented JSON serializer, noticeably faster on the log hot path
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class JSONFormatter(logging.Formatter):
     """Custom JSON formatter for structured logging."""
-    
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON."""
         log_entry = {
@@ -47,12 +55,16 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, 'session_id'):
             log_entry["session_id"] = record.session_id
         
+        if orjson is not None:
+            return orjson.dumps(log_entry, default=str).decode()
         return json.dumps(log_entry, default=str)
 
 
 class ContextFilter(logging.Filter):
     """Filter to add contextual information to log records."""
-    
+
+    __slots__ = ("context",)
+
     def __init__(self, context: Optional[Dict[str, Any]] = None):
         super().__init__()
         self.context = context or {}
@@ -64,52 +76,89 @@ class ContextFilter(logging.Filter):
         return True
 
 
+class PassthroughQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unmodified.
+
+    The stock prepare() pre-formats the message and nulls exc_info, which
+    would flatten tracebacks into the message and starve JSONFormatter's
+    exception field. Records on an in-process SimpleQueue never cross a
+    pickle boundary, so they can be forwarded as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+# Listener draining the log queue on a background thread
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def shutdown_logging() -> None:
+    """Flush and stop the queue listener so buffered records aren't lost."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+# Ensure queued records are flushed on interpreter exit
+atexit.register(shutdown_logging)
+
+
 def setup_logging() -> None:
     """Configure application logging based on settings."""
-    # Create logger
-    logger = logging.getLogger()
-    logger.setLevel(getattr(logging, settings.logging.level.upper()))
-    
-    # Clear existing handlers
-    logger.handlers.clear()
-    
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    
-    if settings.logging.format.lower() == "json":
-        console_formatter = JSONFormatter()
+    global _queue_listener
+
+    # Resolve settings-derived values once
+    log_settings = settings.logging
+    level = logging._nameToLevel[log_settings.level.upper()]
+    is_json = log_settings.format.lower() == "json"
+
+    # One shared formatter for all handlers
+    if is_json:
+        formatter = JSONFormatter()
     else:
-        console_formatter = logging.Formatter(
+        formatter = logging.Formatter(
             fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S"
         )
-    
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
-    
+
+    # Console handler
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
+
     # File handler (if configured)
-    if settings.logging.file:
-        log_file = Path(settings.logging.file)
+    if log_settings.file:
+        log_file = Path(log_settings.file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        
+
         file_handler = logging.handlers.RotatingFileHandler(
             filename=str(log_file),
-            maxBytes=settings.logging.max_size,
-            backupCount=settings.logging.backup_count,
+            maxBytes=log_settings.max_size,
+            backupCount=log_settings.backup_count,
             encoding="utf-8"
         )
-        
-        if settings.logging.format.lower() == "json":
-            file_formatter = JSONFormatter()
-        else:
-            file_formatter = logging.Formatter(
-                fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S"
-            )
-        
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-    
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    # Emitting handlers run on a background thread; request handlers only
+    # pay for an enqueue
+    shutdown_logging()
+    log_queue = queue.SimpleQueue()
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    # Create logger
+    logger = logging.getLogger()
+    logger.setLevel(level)
+
+    # Replace existing handlers with the queue handler
+    logger.handlers.clear()
+    logger.addHandler(PassthroughQueueHandler(log_queue))
+
     # Configure specific loggers
     configure_library_loggers()
 
@@ -144,6 +193,10 @@ class LoggerMixin:
         return get_logger(self.__class__.__name__)
 
 
+# Cached at module level so hot log helpers skip the attribute lookup
+_INFO = logging.INFO
+
+
 def log_with_context(
     logger: logging.Logger,
     level: int,
@@ -169,6 +222,9 @@ def log_api_request(
     user_id: Optional[str] = None,
 ) -> None:
     """Log API request with structured data."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     extra_fields = {
         "request_method": method,
         "request_path": path,
@@ -176,18 +232,16 @@ def log_api_request(
         "duration_ms": duration_ms,
     }
     
-    log_kwargs = {}
+    log_kwargs = {'extra_fields': extra_fields}
     if request_id:
         log_kwargs['request_id'] = request_id
     if user_id:
         log_kwargs['user_id'] = user_id
-    
-    log_with_context(
-        logger,
-        logging.INFO,
+
+    logger.log(
+        _INFO,
         f"{method} {path} - {status_code} ({duration_ms:.2f}ms)",
-        extra_fields=extra_fields,
-        **log_kwargs
+        extra=log_kwargs
     )
 
 
@@ -202,6 +256,9 @@ def log_llm_request(
     request_id: Optional[str] = None,
 ) -> None:
     """Log LLM request with cost and token tracking."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     extra_fields = {
         "llm_provider": provider,
         "llm_model": model,
@@ -214,24 +271,18 @@ def log_llm_request(
     if cost is not None:
         extra_fields["cost_usd"] = cost
     
-    log_kwargs = {}
+    log_kwargs = {'extra_fields': extra_fields}
     if request_id:
         log_kwargs['request_id'] = request_id
-    
+
     message = (
         f"LLM Request - {provider}/{model} "
         f"({prompt_tokens}+{completion_tokens} tokens, {duration_ms:.2f}ms)"
     )
     if cost is not None:
         message += f" ${cost:.4f}"
-    
-    log_with_context(
-        logger,
-        logging.INFO,
-        message,
-        extra_fields=extra_fields,
-        **log_kwargs
-    )
+
+    logger.log(_INFO, message, extra=log_kwargs)
 
 
 def log_vector_search(
@@ -243,6 +294,9 @@ def log_vector_search(
     request_id: Optional[str] = None,
 ) -> None:
     """Log vector search operation."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     extra_fields = {
         "vector_provider": provider,
         "query_length": len(query),
@@ -250,16 +304,14 @@ def log_vector_search(
         "duration_ms": duration_ms,
     }
     
-    log_kwargs = {}
+    log_kwargs = {'extra_fields': extra_fields}
     if request_id:
         log_kwargs['request_id'] = request_id
-    
-    log_with_context(
-        logger,
-        logging.INFO,
+
+    logger.log(
+        _INFO,
         f"Vector Search - {provider} ({results_count} results, {duration_ms:.2f}ms)",
-        extra_fields=extra_fields,
-        **log_kwargs
+        extra=log_kwargs
     )
 
 
@@ -272,6 +324,9 @@ def log_document_processing(
     request_id: Optional[str] = None,
 ) -> None:
     """Log document processing operation."""
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     extra_fields = {
         "filename": filename,
         "file_size_bytes": file_size,
@@ -279,16 +334,14 @@ def log_document_processing(
         "duration_ms": duration_ms,
     }
     
-    log_kwargs = {}
+    log_kwargs = {'extra_fields': extra_fields}
     if request_id:
         log_kwargs['request_id'] = request_id
-    
-    log_with_context(
-        logger,
-        logging.INFO,
+
+    logger.log(
+        _INFO,
         f"Document Processing - {filename} ({chunks_created} chunks, {duration_ms:.2f}ms)",
-        extra_fields=extra_fields,
-        **log_kwargs
+        extra=log_kwargs
     )
 
 
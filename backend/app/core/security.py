@@ -7,35 +7,58 @@ rate limiting, input sanitization, and request validation.
 
 import hashlib
 import hmac
+import os
+import re
 import secrets
 import time
+from base64 import urlsafe_b64encode
+from functools import lru_cache
+from os import urandom
 from typing import List, Optional
 
 from fastapi import HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from fastapi.security.api_key import APIKeyHeader
 
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
 from .config import settings
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# Matches path traversal and characters disallowed in uploaded filenames,
+# compiled once so validation is a single C-level scan
+_DANGEROUS_FILENAME_RE = re.compile(r'\.\.|[/\\<>:"|?*]')
 
-# API Key authentication
-api_key_header = APIKeyHeader(
-    name=settings.security.api_key_header,
-    auto_error=False
-)
+# Collapses runs of whitespace in a single C-level pass
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=1)
+def get_api_key_header() -> APIKeyHeader:
+    """Get the API key header scheme, built on first use."""
+    return APIKeyHeader(
+        name=settings.security.api_key_header,
+        auto_error=False
+    )
 
 
 class APIKeyAuth:
     """API Key authentication handler."""
-    
+
+    __slots__ = ("api_keys", "_api_keys_encoded", "logger")
+
     def __init__(self, api_keys: Optional[List[str]] = None):
         """Initialize with allowed API keys."""
-        self.api_keys = set(api_keys or settings.security.allowed_api_keys)
+        self.api_keys = frozenset(api_keys or settings.security.allowed_api_keys)
+        # Pre-encoded for constant-time comparison without per-call encoding
+        self._api_keys_encoded = tuple(key.encode("utf-8") for key in self.api_keys)
         self.logger = get_logger(self.__class__.__name__)
-    
+
     async def __call__(self, api_key: Optional[str] = None) -> str:
         """Validate API key."""
         if not api_key:
@@ -44,8 +67,12 @@ class APIKeyAuth:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="API key required"
             )
-        
-        if not self.api_keys or api_key not in self.api_keys:
+
+        api_key_bytes = api_key.encode("utf-8")
+        if not any(
+            hmac.compare_digest(api_key_bytes, key)
+            for key in self._api_keys_encoded
+        ):
             self.logger.warning(f"Invalid API key attempted: {api_key[:8]}...")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -58,64 +85,168 @@ class APIKeyAuth:
 
 class RateLimiter:
     """Simple in-memory rate limiter."""
-    
+
+    __slots__ = ("requests_per_minute", "requests", "_calls_since_prune", "logger")
+
+    # Prune stale client entries every N calls instead of on every request
+    _PRUNE_INTERVAL = 1024
+
     def __init__(self, requests_per_minute: int = 100):
         """Initialize rate limiter with requests per minute limit."""
         self.requests_per_minute = requests_per_minute
+        # Per-client (minute, count) pairs, updated in O(1) per request
         self.requests = {}
+        self._calls_since_prune = 0
         self.logger = get_logger(self.__class__.__name__)
-    
+
     def is_allowed(self, client_id: str) -> bool:
         """Check if client is allowed to make request."""
-        now = time.time()
-        minute = int(now // 60)
-        
-        # Clean old entries
-        old_minutes = [m for m in self.requests.keys() if m < minute - 1]
-        for old_minute in old_minutes:
-            del self.requests[old_minute]
-        
-        # Check current minute requests
-        key = (client_id, minute)
-        current_requests = self.requests.get(key, 0)
-        
-        if current_requests >= self.requests_per_minute:
+        current_minute = int(time.time() // 60)
+
+        minute, count = self.requests.get(client_id, (current_minute, 0))
+        count = count + 1 if minute == current_minute else 1
+
+        if count > self.requests_per_minute:
             self.logger.warning(
                 f"Rate limit exceeded for client {client_id}: "
-                f"{current_requests} requests this minute"
+                f"{count - 1} requests this minute"
             )
             return False
-        
-        # Increment counter
-        self.requests[key] = current_requests + 1
+
+        self.requests[client_id] = (current_minute, count)
+
+        # Periodically drop clients that have gone quiet
+        self._calls_since_prune += 1
+        if self._calls_since_prune >= self._PRUNE_INTERVAL:
+            self._calls_since_prune = 0
+            stale = [
+                client for client, (m, _) in self.requests.items()
+                if m < current_minute - 1
+            ]
+            for client in stale:
+                del self.requests[client]
+
         return True
     
     def get_client_id(self, request: Request) -> str:
         """Extract client ID from request."""
-        # Use IP address as client ID
-        client_ip = request.client.host if request.client else "unknown"
-        
-        # Check for forwarded IP headers
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            client_ip = forwarded_for.split(",")[0].strip()
-        
+        # Proxy headers take precedence; X-Real-IP wins over X-Forwarded-For
         real_ip = request.headers.get("X-Real-IP")
         if real_ip:
-            client_ip = real_ip
-        
-        return client_ip
+            return real_ip
+
+        forwarded_for = request.headers.get("X-Forwarded-For")
+        if forwarded_for:
+            # First hop only; partition avoids the list split allocates
+            head, _, _ = forwarded_for.partition(",")
+            return head.strip()
+
+        # Direct connection: use the socket peer address
+        return request.client.host if request.client else "unknown"
+
+
+# Atomic sliding-window check: trim expired entries, count, insert if under
+# the limit. Returns 1 when the request is allowed.
+_RATE_LIMIT_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+if redis.call('ZCARD', key) >= limit then
+    return 0
+end
+redis.call('ZADD', key, now, ARGV[4])
+redis.call('PEXPIRE', key, window)
+return 1
+"""
+
 
+class RedisRateLimiter(RateLimiter):
+    """Rate limiter backed by a Redis sorted set.
 
-# Global rate limiter instance
-rate_limiter = RateLimiter(settings.api.rate_limit_requests)
+    Enforces limits consistently across workers via a single Lua script
+    round trip per request. When Redis is unreachable it falls back to
+    the inherited in-memory counter (per-worker enforcement), backing
+    off before retrying the connection.
+    """
+
+    __slots__ = ("window_ms", "_redis", "_script", "_denied_until", "_backoff_until")
+
+    # Seconds to skip Redis after a connection failure
+    _RETRY_BACKOFF = 30.0
+
+    def __init__(self, requests_per_minute: int = 100):
+        """Initialize Redis-backed rate limiter."""
+        super().__init__(requests_per_minute)
+        self.window_ms = 60_000
+        self._redis = None
+        self._script = None
+        # Local denial cache: skip Redis entirely while a client is blocked
+        self._denied_until = {}
+        self._backoff_until = 0.0
+
+    def _get_script(self):
+        """Lazily connect and register the limiter script."""
+        if self._script is None:
+            self._redis = aioredis.from_url(settings.redis.url)
+            self._script = self._redis.register_script(_RATE_LIMIT_LUA)
+        return self._script
+
+    async def is_allowed(self, client_id: str) -> bool:
+        """Check if client is allowed to make request."""
+        now = time.time()
+
+        denied_until = self._denied_until.get(client_id)
+        if denied_until is not None:
+            if now < denied_until:
+                return False
+            del self._denied_until[client_id]
+
+        if now < self._backoff_until:
+            return RateLimiter.is_allowed(self, client_id)
+
+        try:
+            allowed = await self._get_script()(
+                keys=[f"ratelimit:{client_id}"],
+                args=[int(now * 1000), self.window_ms, self.requests_per_minute,
+                      time.monotonic_ns()],
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Rate limiter Redis unavailable, using in-memory fallback: {e}"
+            )
+            self._backoff_until = now + self._RETRY_BACKOFF
+            return RateLimiter.is_allowed(self, client_id)
+
+        if not allowed:
+            self.logger.warning(f"Rate limit exceeded for client {client_id}")
+            # Deny locally until the oldest window entry can expire
+            self._denied_until[client_id] = now + 1.0
+            return False
+
+        return True
+
+
+@lru_cache(maxsize=1)
+def get_rate_limiter() -> RateLimiter:
+    """Get the global rate limiter, built on first use."""
+    if aioredis is not None:
+        return RedisRateLimiter(settings.api.rate_limit_requests)
+    return RateLimiter(settings.api.rate_limit_requests)
 
 
 async def check_rate_limit(request: Request) -> None:
     """Check rate limit for request."""
+    rate_limiter = get_rate_limiter()
     client_id = rate_limiter.get_client_id(request)
-    
-    if not rate_limiter.is_allowed(client_id):
+
+    if isinstance(rate_limiter, RedisRateLimiter):
+        allowed = await rate_limiter.is_allowed(client_id)
+    else:
+        allowed = rate_limiter.is_allowed(client_id)
+
+    if not allowed:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Rate limit exceeded. Please try again later.",
@@ -131,18 +262,36 @@ def generate_secret_key(length: int = 32) -> str:
 def hash_password(password: str, salt: Optional[str] = None) -> tuple[str, str]:
     """Hash password with salt."""
     if salt is None:
-        salt = secrets.token_hex(16)
-    
+        salt = os.urandom(16).hex()
+
     password_hash = hashlib.pbkdf2_hmac(
         'sha256',
         password.encode('utf-8'),
         salt.encode('utf-8'),
-        100000  # iterations
+        settings.security.pbkdf2_iterations
     )
-    
+
     return password_hash.hex(), salt
 
 
+def hash_password_batch(passwords: List[str]) -> List[tuple[str, str]]:
+    """Hash multiple passwords, generating all salts in one urandom call."""
+    if not passwords:
+        return []
+
+    # One urandom read for all salts instead of one syscall per password
+    salt_bytes = os.urandom(16 * len(passwords))
+    salts = [
+        salt_bytes[i * 16:(i + 1) * 16].hex()
+        for i in range(len(passwords))
+    ]
+
+    return [
+        hash_password(password, salt)
+        for password, salt in zip(passwords, salts)
+    ]
+
+
 def verify_password(password: str, password_hash: str, salt: str) -> bool:
     """Verify password against hash."""
     computed_hash, _ = hash_password(password, salt)
@@ -161,10 +310,7 @@ def sanitize_input(text: str, max_length: int = 10000) -> str:
     
     # Remove or escape potentially dangerous characters
     # For now, just strip and normalize whitespace
-    text = text.strip()
-    text = ' '.join(text.split())  # Normalize whitespace
-    
-    return text
+    return _WHITESPACE_RE.sub(" ", text.strip())
 
 
 def validate_file_upload(
@@ -200,8 +346,7 @@ def validate_file_upload(
         )
     
     # Check for dangerous characters in filename
-    dangerous_chars = ['..', '/', '\\', '<', '>', ':', '"', '|', '?', '*']
-    if any(char in filename for char in dangerous_chars):
+    if _DANGEROUS_FILENAME_RE.search(filename):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Filename contains invalid characters"
@@ -210,7 +355,9 @@ def validate_file_upload(
 
 def create_request_id() -> str:
     """Create a unique request ID for tracing."""
-    return secrets.token_urlsafe(16)
+    # Inlined secrets.token_urlsafe(16): one urandom read plus base64,
+    # without the wrapper call layers
+    return urlsafe_b64encode(urandom(16)).rstrip(b"=").decode("ascii")
 
 
 def get_request_id(request: Request) -> str:
@@ -221,30 +368,43 @@ def get_request_id(request: Request) -> str:
     return request_id
 
 
+# Recommended security headers, compiled once at import instead of being
+# rebuilt per response
+_SECURITY_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("X-XSS-Protection", "1; mode=block"),
+    ("Strict-Transport-Security", "max-age=31536000; includeSubDomains"),
+    ("Content-Security-Policy", (
+        "default-src 'self'; "
+        "script-src 'self' 'unsafe-inline'; "
+        "style-src 'self' 'unsafe-inline'; "
+        "img-src 'self' data: https:;"
+    )),
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    ("Permissions-Policy", (
+        "camera=(), microphone=(), geolocation=(), "
+        "payment=(), usb=(), magnetometer=(), gyroscope=()"
+    )),
+)
+
+# Pre-encoded variant for ASGI middleware that deals in raw header bytes
+SECURITY_HEADERS_ENCODED = tuple(
+    (name.encode("latin-1"), value.encode("latin-1"))
+    for name, value in _SECURITY_HEADERS
+)
+
+
 class SecurityHeaders:
     """Security headers middleware."""
-    
+
     @staticmethod
-    def get_security_headers() -> dict:
-        """Get recommended security headers."""
-        return {
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block",
-            "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
-            "Content-Security-Policy": (
-                "default-src 'self'; "
-                "script-src 'self' 'unsafe-inline'; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data: https:;"
-            ),
-            "Referrer-Policy": "strict-origin-when-cross-origin",
-            "Permissions-Policy": (
-                "camera=(), microphone=(), geolocation=(), "
-                "payment=(), usb=(), magnetometer=(), gyroscope=()"
-            )
-        }
+    def get_security_headers() -> tuple:
+        """Get recommended security headers as (name, value) pairs."""
+        return _SECURITY_HEADERS
 
 
-# Create API key authentication instance
-api_key_auth = APIKeyAuth()
+@lru_cache(maxsize=1)
+def get_api_key_auth() -> APIKeyAuth:
+    """Get the API key authentication handler, built on first use."""
+    return APIKeyAuth()
@@ -5,19 +5,22 @@ This module sets up the FastAPI application with middleware, error handling,
 and route registration.
 """
 
+import json
 import time
+
+import orjson
 from contextlib import asynccontextmanager
 from typing import Dict, Any
 
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.responses import ORJSONResponse
 
 from .core import settings, setup_logging, get_logger, check_rate_limit
-from .core.security import SecurityHeaders, get_request_id
-from .services.factory import ServiceFactory
+from .core.logging import shutdown_logging
+from .core.security import SECURITY_HEADERS_ENCODED, create_request_id
+from .services.factory import ServiceFactory, warm_registry_in_background
 
 
 # Setup logging
@@ -32,6 +35,9 @@ async def lifespan(app: FastAPI):
     logger.info(f"Starting {settings.app_name} v{settings.app_version}")
     logger.info(f"Environment: {settings.environment}")
     
+    # Pull heavy provider imports in parallel with the rest of startup
+    warm_registry_in_background()
+    
     # Validate service connections
     try:
         connections = await ServiceFactory.validate_all_connections()
@@ -48,6 +54,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info(f"Shutting down {settings.app_name}")
     ServiceFactory.clear_instances()
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -55,98 +62,190 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="A production-ready RAG chatbot with modular architecture",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
     docs_url="/docs" if settings.environment != "production" else None,
     redoc_url="/redoc" if settings.environment != "production" else None,
 )
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests."""
-    
-    async def dispatch(self, request: Request, call_next):
+class RequestLoggingMiddleware:
+    """Pure ASGI middleware for logging HTTP requests.
+
+    Avoids BaseHTTPMiddleware's per-request task pair and response
+    buffering by wrapping ``send`` directly.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
         """Process request and log details."""
-        start_time = time.time()
-        request_id = get_request_id(request)
-        
-        # Add request ID to request state
-        request.state.request_id = request_id
-        
-        # Process request
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+
+        # Reuse the incoming request ID bytes if the client supplied them
+        rid_bytes = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                rid_bytes = value
+                break
+        if rid_bytes:
+            request_id = rid_bytes.decode("latin-1")
+        else:
+            request_id = create_request_id()
+            rid_bytes = request_id.encode("ascii")
+
+        # Expose the request ID via request.state for downstream handlers
+        scope.setdefault("state", {})["request_id"] = request_id
+        request_id_header = (b"x-request-id", rid_bytes)
+
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", ()))
+                headers.append(request_id_header)
+                message["headers"] = headers
+            await send(message)
+
         try:
-            response = await call_next(request)
-            duration_ms = (time.time() - start_time) * 1000
-            
-            # Log request
-            logger.info(
-                f"{request.method} {request.url.path} - "
-                f"{response.status_code} ({duration_ms:.2f}ms)",
-                extra={
-                    "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "duration_ms": duration_ms,
-                    "client_ip": request.client.host if request.client else "unknown",
-                }
-            )
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            
-            return response
-        
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             logger.error(
-                f"{request.method} {request.url.path} - ERROR ({duration_ms:.2f}ms): {e}",
+                f"{method} {path} - ERROR ({duration_ms:.2f}ms): {e}",
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
-                    "path": request.url.path,
+                    "method": method,
+                    "path": path,
                     "duration_ms": duration_ms,
                     "error": str(e),
                 }
             )
             raise
 
+        # Log after the response has been handed off to the server
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        logger.info(
+            f"{method} {path} - {status_code} ({duration_ms:.2f}ms)",
+            extra={
+                "request_id": request_id,
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "duration_ms": duration_ms,
+                "client_ip": client[0] if client else "unknown",
+            }
+        )
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware for adding security headers."""
-    
-    async def dispatch(self, request: Request, call_next):
+
+class SecurityHeadersMiddleware:
+    """Pure ASGI middleware for adding security headers."""
+
+    def __init__(self, app):
+        self.app = app
+        # Already encoded at import time; hot path is one list concat
+        self._headers = list(SECURITY_HEADERS_ENCODED)
+
+    async def __call__(self, scope, receive, send):
         """Add security headers to response."""
-        response = await call_next(request)
-        
-        # Add security headers
-        security_headers = SecurityHeaders.get_security_headers()
-        for header, value in security_headers.items():
-            response.headers[header] = value
-        
-        return response
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + self._headers
+            await send(message)
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware for rate limiting."""
-    
-    async def dispatch(self, request: Request, call_next):
+        await self.app(scope, receive, send_wrapper)
+
+
+# Liveness probe paths answered without touching the middleware stack
+_PROBE_PATHS = frozenset({"/health"})
+
+# Body serialized once at import; load balancers hit this endpoint constantly
+_HEALTH_BYTES = orjson.dumps({"status": "healthy"})
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BYTES)).encode("latin-1")),
+]
+
+
+class ProbeShortCircuitMiddleware:
+    """Outermost ASGI middleware answering liveness probes directly.
+
+    Probes skip logging, rate limiting, CORS and routing entirely; each
+    hit costs two sends of pre-built messages.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        """Serve probe paths from the cached response."""
+        if scope["type"] == "http" and scope["path"] in _PROBE_PATHS:
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": _HEALTH_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": _HEALTH_BYTES})
+            return
+
+        await self.app(scope, receive, send)
+
+
+# Paths exempt from rate limiting (health probes and docs)
+_RATE_LIMIT_SKIP_PATHS = frozenset({"/health", "/ready", "/docs", "/redoc", "/openapi.json"})
+
+# Pre-built 429 response, serialized once at import
+_RATE_LIMIT_BODY = json.dumps(
+    {"error": "Rate limit exceeded. Please try again later."}
+).encode("utf-8")
+_RATE_LIMIT_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_RATE_LIMIT_BODY)).encode("latin-1")),
+    (b"retry-after", b"60"),
+]
+
+
+class RateLimitMiddleware:
+    """Pure ASGI middleware for rate limiting."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
         """Check rate limits before processing request."""
-        # Skip rate limiting for health checks and docs
-        if request.url.path in ["/health", "/ready", "/docs", "/redoc", "/openapi.json"]:
-            return await call_next(request)
-        
+        # Skip rate limiting for non-HTTP scopes, health checks and docs
+        if scope["type"] != "http" or scope["path"] in _RATE_LIMIT_SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
         # Check rate limit
         try:
-            await check_rate_limit(request)
+            await check_rate_limit(Request(scope, receive))
         except HTTPException:
             # Rate limit exceeded
-            return JSONResponse(
-                status_code=429,
-                content={"error": "Rate limit exceeded. Please try again later."},
-                headers={"Retry-After": "60"}
-            )
-        
-        return await call_next(request)
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": _RATE_LIMIT_HEADERS,
+            })
+            await send({"type": "http.response.body", "body": _RATE_LIMIT_BODY})
+            return
+
+        await self.app(scope, receive, send)
 
 
 # Add middleware (order matters - last added is executed first)
@@ -170,6 +269,9 @@ if settings.environment == "production":
         allowed_hosts=["*"]  # Configure with actual hosts in production
     )
 
+# Added last so it runs first; probes never enter the stack above
+app.add_middleware(ProbeShortCircuitMiddleware)
+
 
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -182,7 +284,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc_info=True
     )
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -196,7 +298,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     """HTTP exception handler."""
     request_id = getattr(request.state, "request_id", "unknown")
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -209,7 +311,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.get("/health")
 async def health_check():
     """Basic health check endpoint."""
-    return {"status": "healthy", "timestamp": time.time()}
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/ready")
@@ -222,7 +324,7 @@ async def readiness_check():
         all_healthy = all(connections.values())
         status_code = 200 if all_healthy else 503
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status_code,
             content={
                 "status": "ready" if all_healthy else "not ready",
@@ -233,7 +335,7 @@ async def readiness_check():
     
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "not ready",
@@ -269,5 +371,9 @@ if __name__ == "__main__":
         port=settings.api.port,
         reload=settings.api.reload,
         workers=1 if settings.api.reload else settings.api.workers,
+        loop="uvloop",  # libuv event loop, much faster socket I/O
+        http="httptools",  # C HTTP parser
+        timeout_keep_alive=30,  # amortize TCP/TLS handshakes across requests
+        backlog=2048,  # absorb connection bursts without SYN drops
         log_config=None,  # Use our custom logging
     )
@@ -6,9 +6,11 @@ enabling the Strategy pattern for easy component swapping.
 """
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict, field_serializer, field_validator
 
 
 class Document(BaseModel):
@@ -21,6 +23,8 @@ class Document(BaseModel):
     page_number: Optional[int] = None
     chunk_index: Optional[int] = None
 
+    model_config = ConfigDict(extra="ignore")
+
 
 class SearchResult(BaseModel):
     """Search result from vector store."""
@@ -29,23 +33,51 @@ class SearchResult(BaseModel):
     score: float
     relevance_score: Optional[float] = None
 
+    model_config = ConfigDict(extra="ignore")
+
+
+@dataclass(slots=True)
+class LLMResponse:
+    """Response from language model.
+
+    A slotted dataclass rather than a Pydantic model: one is built per LLM
+    call, and the common fields live as attributes so no metadata dict is
+    allocated unless a provider attaches extras.
+    """
 
-class LLMResponse(BaseModel):
-    """Response from language model."""
-    
     content: str
     model: str
-    usage: Dict[str, int] = {}
-    metadata: Dict[str, Any] = {}
+    usage: Dict[str, int] = field(default_factory=dict)
+    finish_reason: Optional[str] = None
+    cost_usd: Optional[float] = None
+    duration_ms: float = 0.0
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
 
 class EmbeddingResponse(BaseModel):
-    """Response from embedding service."""
-    
-    embedding: List[float]
+    """Response from embedding service.
+
+    The embedding is held as a float32 ndarray, which is ~7x smaller than a
+    list of Python floats and feeds NumPy similarity math directly.
+    """
+
+    embedding: np.ndarray
     model: str
     usage: Dict[str, int] = {}
 
+    model_config = ConfigDict(extra="ignore", arbitrary_types_allowed=True)
+
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def _coerce_embedding(cls, v: Any) -> np.ndarray:
+        """Convert incoming vectors to a compact float32 array."""
+        return np.asarray(v, dtype=np.float32)
+
+    @field_serializer("embedding")
+    def _serialize_embedding(self, v: np.ndarray) -> List[float]:
+        """Serialize the embedding back to a plain list for transport."""
+        return v.tolist()
+
 
 class LLMProvider(ABC):
     """Abstract base class for language model providers."""
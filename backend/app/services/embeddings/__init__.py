@@ -5,4 +5,6 @@ This module contains implementations of various embedding services
 following the EmbeddingsService interface.
 """
 
-__all__ = []
+from .matrix import EmbeddingMatrix
+
+__all__ = ["EmbeddingMatrix"]
@@ -0,0 +1,100 @@
+"""
+Structure-of-arrays container for document embeddings.
+
+This module provides a NumPy-backed embedding matrix so similarity scoring
+over many documents runs as one BLAS matrix-vector product instead of a
+Python loop of per-pair cosines.
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..base import Document
+
+
+class EmbeddingMatrix:
+    """Contiguous float32 matrix of document embeddings.
+
+    Rows are stored in one `(N, D)` array with a parallel list of documents,
+    keeping the data cache-friendly and letting `topk` score every document
+    with a single `matrix @ query` call.
+    """
+
+    __slots__ = ("_matrix", "_size", "_documents", "_normalized")
+
+    def __init__(self, dimension: Optional[int] = None, capacity: int = 64):
+        """Initialize an empty matrix, optionally with a known dimension."""
+        self._matrix: Optional[np.ndarray] = (
+            np.empty((capacity, dimension), dtype=np.float32)
+            if dimension is not None else None
+        )
+        self._size = 0
+        self._documents: List[Document] = []
+        self._normalized = False
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def documents(self) -> List[Document]:
+        """Documents in row order."""
+        return self._documents
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """The `(N, D)` embedding matrix (a view over the growth buffer)."""
+        if self._matrix is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._matrix[:self._size]
+
+    def add(self, document: Document, embedding: Sequence[float]) -> None:
+        """Append a document and its embedding vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+
+        if self._matrix is None:
+            self._matrix = np.empty((64, vector.shape[0]), dtype=np.float32)
+
+        # Double the buffer on overflow (amortized O(1) appends)
+        if self._size == self._matrix.shape[0]:
+            grown = np.empty(
+                (self._matrix.shape[0] * 2, self._matrix.shape[1]),
+                dtype=np.float32,
+            )
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+        self._matrix[self._size] = vector
+        self._size += 1
+        self._documents.append(document)
+        self._normalized = False
+
+    def normalize(self) -> None:
+        """L2-normalize all rows in place so scoring is a pure dot product."""
+        rows = self.matrix
+        if rows.size == 0:
+            return
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        np.divide(rows, norms, out=rows, where=norms > 0)
+        self._normalized = True
+
+    def topk(self, query: Sequence[float], k: int) -> List[Tuple[Document, float]]:
+        """Return the top-k documents by cosine similarity to the query."""
+        if self._size == 0 or k <= 0:
+            return []
+
+        if not self._normalized:
+            self.normalize()
+
+        q = np.asarray(query, dtype=np.float32)
+        q_norm = np.linalg.norm(q)
+        if q_norm > 0:
+            q = q / q_norm
+
+        # One SGEMV over all rows, then a partial sort for the top k
+        scores = self.matrix @ q
+        k = min(k, self._size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+
+        return [(self._documents[i], float(scores[i])) for i in top]
@@ -5,28 +5,59 @@ This module provides OpenAI embeddings integration following the EmbeddingsServi
 """
 
 import asyncio
+import base64
 import time
-from typing import List, Optional
+from hashlib import blake2b
+from pathlib import Path
+from typing import Any, List, Optional
 
-from openai import AsyncOpenAI
+import numpy as np
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 from ...core.config import settings
 from ...core.logging import get_logger
 from ..base import EmbeddingsService, EmbeddingResponse
 
 
+def _is_rate_limit_error(exc: BaseException) -> bool:
+    """Retry predicate for OpenAI 429s, without importing openai upfront."""
+    # openai is already imported by the time a request can fail
+    from openai import RateLimitError
+    return isinstance(exc, RateLimitError)
+
+
+def _decode_embedding(data: Any) -> np.ndarray:
+    """Decode an API embedding, handling base64 and list formats."""
+    if isinstance(data, str):
+        return np.frombuffer(base64.b64decode(data), dtype=np.float32)
+    return np.asarray(data, dtype=np.float32)
+
+
 class OpenAIEmbeddings(EmbeddingsService):
     """OpenAI embeddings service implementation."""
     
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """Initialize OpenAI embeddings service."""
         self.api_key = api_key or settings.openai.api_key
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self._client = None
         self.logger = get_logger(self.__class__.__name__)
         
         # Model configuration
         self.default_model = settings.openai.embedding_model
         
+        # Maximum concurrent batch requests against the API
+        self.max_concurrency = kwargs.get("max_concurrency", 8)
+        
+        # Per-model tiktoken encoders, built on first use
+        self._encoders = {}
+
+        # On-disk embedding cache keyed by (model, text hash); disabled
+        # unless a cache directory is configured
+        cache_dir = kwargs.get("cache_dir", settings.embedding_cache_dir)
+        self._cache_dir = Path(cache_dir) if cache_dir else None
+        if self._cache_dir is not None:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
         # Model dimensions
         self.model_dimensions = {
             "text-embedding-ada-002": 1536,
@@ -43,6 +74,42 @@ class OpenAIEmbeddings(EmbeddingsService):
         
         self.logger.info(f"Initialized OpenAI embeddings with model: {self.default_model}")
     
+    @property
+    def client(self):
+        """OpenAI client, created on first use.
+
+        Deferring the openai import keeps it off the worker cold-start path.
+        """
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(api_key=self.api_key)
+        return self._client
+    
+    def _cache_path(self, model: str, text: str) -> Path:
+        """Build the cache file path for a (model, text) pair."""
+        key = blake2b(f"{model}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+        return self._cache_dir / f"{key}.npy"
+
+    def _cache_get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """Look up a cached embedding, returning None on miss."""
+        if self._cache_dir is None:
+            return None
+        path = self._cache_path(model, text)
+        try:
+            return np.load(path) if path.exists() else None
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Embedding cache read failed: {e}")
+            return None
+
+    def _cache_put(self, model: str, text: str, embedding: np.ndarray) -> None:
+        """Store an embedding in the on-disk cache."""
+        if self._cache_dir is None:
+            return
+        try:
+            np.save(self._cache_path(model, text), embedding)
+        except OSError as e:
+            self.logger.warning(f"Embedding cache write failed: {e}")
+
     async def embed_text(
         self,
         text: str,
@@ -51,20 +118,29 @@ class OpenAIEmbeddings(EmbeddingsService):
     ) -> EmbeddingResponse:
         """Generate embedding for a single text."""
         model = model or self.default_model
-        start_time = time.time()
-        
+        start_ns = time.perf_counter_ns()
+
+        cached = self._cache_get(model, text)
+        if cached is not None:
+            return EmbeddingResponse(embedding=cached, model=model, usage={})
+
         try:
+            # Request base64-packed floats to skip JSON number parsing
+            kwargs.setdefault("encoding_format", "base64")
             response = await self.client.embeddings.create(
                 model=model,
                 input=text,
                 **kwargs
             )
             
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
-            # Extract embedding and usage
+            # Extract embedding and usage via direct attribute access
             embedding_data = response.data[0]
-            usage = response.usage.dict() if response.usage else {}
+            usage = {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "total_tokens": response.usage.total_tokens,
+            } if response.usage else {}
             
             # Calculate cost
             cost = self._calculate_cost(model, usage)
@@ -76,14 +152,17 @@ class OpenAIEmbeddings(EmbeddingsService):
                 f"duration: {duration_ms:.2f}ms"
             )
             
+            embedding = _decode_embedding(embedding_data.embedding)
+            self._cache_put(model, text, embedding)
+
             return EmbeddingResponse(
-                embedding=embedding_data.embedding,
+                embedding=embedding,
                 model=model,
                 usage=usage
             )
-        
+
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(f"OpenAI embedding error after {duration_ms:.2f}ms: {e}")
             raise
     
@@ -100,21 +179,41 @@ class OpenAIEmbeddings(EmbeddingsService):
         if not texts:
             return []
         
-        # Process in batches to avoid API limits
-        all_responses = []
+        # Embed each distinct text once; duplicates reuse the same response
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) < len(texts):
+            self.logger.debug(
+                f"Deduplicated {len(texts)} texts to {len(unique_texts)} unique"
+            )
+        
+        # Dispatch batches concurrently; retries in _embed_batch handle 429s
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_responses = await self._embed_batch(batch, model, **kwargs)
-            all_responses.extend(batch_responses)
-            
-            # Small delay between batches to avoid rate limits
-            if i + batch_size < len(texts):
-                await asyncio.sleep(0.1)
+        async def embed_one_batch(batch: List[str]) -> List[EmbeddingResponse]:
+            async with semaphore:
+                return await self._embed_batch(batch, model, **kwargs)
+        
+        batch_results = await asyncio.gather(*(
+            embed_one_batch(unique_texts[i:i + batch_size])
+            for i in range(0, len(unique_texts), batch_size)
+        ))
+        
+        # Scatter unique results back to the original positions
+        response_by_text = {}
+        for batch in batch_results:
+            for text, response in zip(unique_texts[len(response_by_text):], batch):
+                response_by_text[text] = response
+        all_responses = [response_by_text[text] for text in texts]
         
         self.logger.info(f"Generated {len(all_responses)} embeddings in batches")
         return all_responses
     
+    @retry(
+        retry=retry_if_exception(_is_rate_limit_error),
+        wait=wait_exponential_jitter(initial=1, max=30),
+        stop=stop_after_attempt(5),
+        reraise=True,
+    )
     async def _embed_batch(
         self,
         texts: List[str],
@@ -122,43 +221,67 @@ class OpenAIEmbeddings(EmbeddingsService):
         **kwargs
     ) -> List[EmbeddingResponse]:
         """Embed a batch of texts."""
-        start_time = time.time()
-        
+        start_ns = time.perf_counter_ns()
+
+        # Serve cache hits locally and only send misses to the API
+        response_by_text = {}
+        misses = texts
+        if self._cache_dir is not None:
+            misses = []
+            for text in texts:
+                cached = self._cache_get(model, text)
+                if cached is not None:
+                    response_by_text[text] = EmbeddingResponse(
+                        embedding=cached, model=model, usage={}
+                    )
+                else:
+                    misses.append(text)
+            if not misses:
+                return [response_by_text[text] for text in texts]
+
         try:
+            # Request base64-packed floats to skip JSON number parsing
+            kwargs.setdefault("encoding_format", "base64")
             response = await self.client.embeddings.create(
                 model=model,
-                input=texts,
+                input=misses,
                 **kwargs
             )
-            
-            duration_ms = (time.time() - start_time) * 1000
-            usage = response.usage.dict() if response.usage else {}
+
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+            usage = {
+                "prompt_tokens": response.usage.prompt_tokens,
+                "total_tokens": response.usage.total_tokens,
+            } if response.usage else {}
             cost = self._calculate_cost(model, usage)
-            
+
             # Log batch request
             self.logger.debug(
                 f"Generated batch embeddings - model: {model}, "
-                f"batch_size: {len(texts)}, "
+                f"batch_size: {len(misses)}, "
                 f"tokens: {usage.get('total_tokens', 0)}, "
                 f"duration: {duration_ms:.2f}ms"
             )
-            
+
             # Create response objects
-            responses = []
-            for i, embedding_data in enumerate(response.data):
-                responses.append(EmbeddingResponse(
-                    embedding=embedding_data.embedding,
+            # model_construct skips re-validation; the embedding is already
+            # a float32 ndarray from _decode_embedding
+            for text, embedding_data in zip(misses, response.data):
+                embedding = _decode_embedding(embedding_data.embedding)
+                self._cache_put(model, text, embedding)
+                response_by_text[text] = EmbeddingResponse.model_construct(
+                    embedding=embedding,
                     model=model,
                     usage={
-                        "total_tokens": usage.get('total_tokens', 0) // len(texts),
-                        "prompt_tokens": usage.get('prompt_tokens', 0) // len(texts),
+                        "total_tokens": usage.get('total_tokens', 0) // len(misses),
+                        "prompt_tokens": usage.get('prompt_tokens', 0) // len(misses),
                     }
-                ))
-            
-            return responses
+                )
+
+            return [response_by_text[text] for text in texts]
         
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             self.logger.error(
                 f"OpenAI batch embedding error after {duration_ms:.2f}ms: {e}"
             )
@@ -172,8 +295,8 @@ class OpenAIEmbeddings(EmbeddingsService):
     async def validate_connection(self) -> bool:
         """Validate OpenAI embeddings API connection."""
         try:
-            # Make a minimal API call to test connection
-            await self.embed_text("test", model=self.default_model)
+            # Hit a free metadata endpoint instead of paying for an embedding
+            await self.client.models.list()
             self.logger.info("OpenAI embeddings connection validated successfully")
             return True
         
@@ -201,26 +324,59 @@ class OpenAIEmbeddings(EmbeddingsService):
         embedding2: List[float]
     ) -> float:
         """Calculate cosine similarity between two embeddings."""
-        import math
-        
-        # Calculate dot product
-        dot_product = sum(a * b for a, b in zip(embedding1, embedding2))
-        
+        query = np.asarray(embedding1, dtype=np.float32)
+        document = np.asarray(embedding2, dtype=np.float32)
+
         # Calculate magnitudes
-        magnitude1 = math.sqrt(sum(a * a for a in embedding1))
-        magnitude2 = math.sqrt(sum(b * b for b in embedding2))
-        
+        magnitude1 = np.linalg.norm(query)
+        magnitude2 = np.linalg.norm(document)
+
         # Calculate cosine similarity
         if magnitude1 == 0 or magnitude2 == 0:
             return 0.0
-        
-        return dot_product / (magnitude1 * magnitude2)
+
+        return float(query @ document / (magnitude1 * magnitude2))
+
+    async def similarity_batch(
+        self,
+        query_embedding: List[float],
+        embeddings: List[List[float]]
+    ) -> List[float]:
+        """Calculate cosine similarity of one query against many embeddings."""
+        if not embeddings:
+            return []
+
+        query = np.asarray(query_embedding, dtype=np.float32)
+        matrix = np.asarray(embeddings, dtype=np.float32)
+
+        query_norm = np.linalg.norm(query)
+        row_norms = np.linalg.norm(matrix, axis=1)
+
+        # One BLAS matrix-vector product instead of a Python loop per row
+        scores = matrix @ query
+        denominators = row_norms * query_norm
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(denominators > 0, scores / denominators, 0.0)
+
+        return scores.tolist()
+    
+    def _get_encoder(self, model: str):
+        """Get the cached tiktoken encoder for a model."""
+        encoder = self._encoders.get(model)
+        if encoder is None:
+            import tiktoken
+            try:
+                encoder = tiktoken.encoding_for_model(model)
+            except KeyError:
+                encoder = tiktoken.get_encoding("cl100k_base")
+            self._encoders[model] = encoder
+        return encoder
     
     def truncate_text(self, text: str, model: Optional[str] = None) -> str:
         """Truncate text to fit model's token limit."""
         model = model or self.default_model
         
-        # Approximate token limits for embedding models
+        # Token limits for embedding models
         token_limits = {
             "text-embedding-ada-002": 8191,
             "text-embedding-3-small": 8191,
@@ -229,16 +385,17 @@ class OpenAIEmbeddings(EmbeddingsService):
         
         max_tokens = token_limits.get(model, 8191)
         
-        # Rough approximation: 1 token ≈ 4 characters
-        max_chars = max_tokens * 4
+        # Token-accurate truncation: encode once, slice, decode
+        encoder = self._get_encoder(model)
+        tokens = encoder.encode(text)
         
-        if len(text) <= max_chars:
+        if len(tokens) <= max_tokens:
             return text
         
         # Truncate and log warning
-        truncated = text[:max_chars]
+        truncated = encoder.decode(tokens[:max_tokens])
         self.logger.warning(
-            f"Text truncated from {len(text)} to {len(truncated)} characters "
+            f"Text truncated from {len(tokens)} to {max_tokens} tokens "
             f"for model {model}"
         )
         
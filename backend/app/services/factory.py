@@ -5,7 +5,13 @@ This module implements the Factory pattern to create appropriate service instanc
 based on configuration, enabling easy component swapping and dependency injection.
 """
 
+import asyncio
+import importlib
+import sys
+import threading
+import time
 from typing import Dict, Optional, Type, Any
+from weakref import WeakValueDictionary
 
 from ..core.config import settings
 from ..core.logging import get_logger
@@ -14,6 +20,97 @@ from .base import LLMProvider, EmbeddingsService, VectorStore, RetrievalStrategy
 logger = get_logger(__name__)
 
 
+# Declarative table of known implementations, imported on first use so
+# importing this module doesn't pay for openai/pinecone/chromadb imports
+_LAZY_REGISTRY: Dict[str, Dict[str, str]] = {
+    "llm": {"openai": ".llm.openai_provider:OpenAIProvider"},
+    "embeddings": {"openai": ".embeddings.openai_embeddings:OpenAIEmbeddings"},
+    "vector_store": {
+        "pinecone": ".vectorstore.pinecone_store:PineconeStore",
+        "chromadb": ".vectorstore.chromadb_store:ChromaDBStore",
+    },
+    "retrieval_strategy": {"similarity": ".retrieval.similarity_strategy:SimilarityStrategy"},
+    "chat_service": {"default": ".chat.default_chat_service:DefaultChatService"},
+}
+
+
+# Declared implementations whose import already failed; they are neither
+# re-probed nor advertised as available
+_lazy_failed: set = set()
+
+
+def _load_lazy(category: str, name: str) -> Optional[type]:
+    """Import a lazily-declared implementation, or None if unavailable."""
+    target = _LAZY_REGISTRY[category].get(name)
+    if target is None or (category, name) in _lazy_failed:
+        return None
+    
+    module_name, _, attr = target.partition(":")
+    try:
+        module = importlib.import_module(module_name, package=__package__)
+    except ImportError:
+        _lazy_failed.add((category, name))
+        logger.debug(f"{category} implementation not available: {name}")
+        return None
+    return getattr(module, attr)
+
+
+def _known_names(registry: Dict[str, Any], category: str) -> list:
+    """All names usable for a category: registered plus importable declared.
+
+    Declared names are probed (imports are cached by sys.modules and the
+    failure set), so a missing optional dependency never shows up as
+    available.
+    """
+    names = set(registry)
+    for name in _LAZY_REGISTRY[category]:
+        if name not in names and _load_lazy(category, name) is not None:
+            names.add(name)
+    return sorted(names)
+
+
+# Instances shared by construction signature (hash consing); entries
+# disappear once no caller holds the instance
+_constructed: "WeakValueDictionary[tuple, Any]" = WeakValueDictionary()
+
+
+def _construct(category: str, name: str, service_class: type, kwargs: Dict[str, Any]) -> Any:
+    """Build an instance, reusing one constructed with identical kwargs."""
+    try:
+        key = (category, name, tuple(sorted(kwargs.items())))
+        hash(key)
+    except TypeError:
+        # Unhashable kwargs: construct normally
+        return service_class(**kwargs)
+    
+    instance = _constructed.get(key)
+    if instance is None:
+        instance = service_class(**kwargs)
+        try:
+            _constructed[key] = instance
+        except TypeError:
+            # Types without weakref support just skip the cache
+            pass
+    return instance
+
+
+def warm_registry_in_background() -> threading.Thread:
+    """Import all declared implementations on a daemon thread.
+
+    Startup proceeds while the heavy provider imports load in parallel;
+    a request arriving before the warm-up finishes just imports inline
+    via the lazy-resolution path in create_*.
+    """
+    def _warm() -> None:
+        for category, targets in _LAZY_REGISTRY.items():
+            for name in targets:
+                _load_lazy(category, name)
+    
+    thread = threading.Thread(target=_warm, name="service-registry-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
 class ServiceFactory:
     """Factory class for creating service instances."""
     
@@ -24,37 +121,63 @@ class ServiceFactory:
     _retrieval_strategies: Dict[str, Type[RetrievalStrategy]] = {}
     _chat_services: Dict[str, Type[ChatService]] = {}
     
-    # Singleton instances
-    _instances: Dict[str, Any] = {}
+    # Default provider names, bound once so dispatch skips a Pydantic
+    # attribute read per call; refresh_defaults() re-reads them
+    _default_llm_provider: str = settings.llm_provider
+    _default_embeddings_provider: str = settings.embeddings_provider
+    _default_vector_store_provider: str = settings.vector_store_provider
+    
+    # Singleton instances, one dict per category so cached resolution is a
+    # single dict.get with no key formatting
+    _llm_instances: Dict[str, LLMProvider] = {}
+    _embeddings_instances: Dict[str, EmbeddingsService] = {}
+    _vector_store_instances: Dict[str, VectorStore] = {}
+    _retrieval_instances: Dict[str, RetrievalStrategy] = {}
+    _chat_instances: Dict[str, ChatService] = {}
+    
+    # Memoized get_available_providers result; registrations invalidate it
+    _available_cache: Optional[Dict[str, tuple]] = None
+    
+    # Cached connection-validation result (readiness probes fire every few
+    # seconds; back-to-back probes within the TTL share one validation)
+    _validation_ttl: float = 10.0
+    _validation_result: Optional[Dict[str, bool]] = None
+    _validation_expires_at: float = 0.0
     
     @classmethod
     def register_llm_provider(cls, name: str, provider_class: Type[LLMProvider]) -> None:
         """Register an LLM provider implementation."""
-        cls._llm_providers[name] = provider_class
+        # Interned keys let dict probes hit the pointer-equality fast path
+        cls._llm_providers[sys.intern(name)] = provider_class
+        cls._available_cache = None
         logger.info(f"Registered LLM provider: {name}")
     
     @classmethod
     def register_embeddings_service(cls, name: str, service_class: Type[EmbeddingsService]) -> None:
         """Register an embeddings service implementation."""
-        cls._embeddings_services[name] = service_class
+        cls._embeddings_services[sys.intern(name)] = service_class
+        cls._available_cache = None
         logger.info(f"Registered embeddings service: {name}")
     
     @classmethod
     def register_vector_store(cls, name: str, store_class: Type[VectorStore]) -> None:
         """Register a vector store implementation."""
-        cls._vector_stores[name] = store_class
+        cls._vector_stores[sys.intern(name)] = store_class
+        cls._available_cache = None
         logger.info(f"Registered vector store: {name}")
     
     @classmethod
     def register_retrieval_strategy(cls, name: str, strategy_class: Type[RetrievalStrategy]) -> None:
         """Register a retrieval strategy implementation."""
-        cls._retrieval_strategies[name] = strategy_class
+        cls._retrieval_strategies[sys.intern(name)] = strategy_class
+        cls._available_cache = None
         logger.info(f"Registered retrieval strategy: {name}")
     
     @classmethod
     def register_chat_service(cls, name: str, service_class: Type[ChatService]) -> None:
         """Register a chat service implementation."""
-        cls._chat_services[name] = service_class
+        cls._chat_services[sys.intern(name)] = service_class
+        cls._available_cache = None
         logger.info(f"Registered chat service: {name}")
     
     @classmethod
@@ -64,17 +187,24 @@ class ServiceFactory:
         **kwargs
     ) -> LLMProvider:
         """Create an LLM provider instance."""
-        provider_name = provider_name or settings.llm_provider
+        provider_name = provider_name or cls._default_llm_provider
         
-        if provider_name not in cls._llm_providers:
-            available = list(cls._llm_providers.keys())
-            raise ValueError(
-                f"Unknown LLM provider: {provider_name}. "
-                f"Available providers: {available}"
-            )
+        provider_class = cls._llm_providers.get(provider_name)
+        if provider_class is None:
+            provider_class = _load_lazy("llm", provider_name)
+            if provider_class is None:
+                if provider_name in _LAZY_REGISTRY["llm"]:
+                    raise ValueError(
+                        f"LLM provider not available: {provider_name} "
+                        f"(declared, but its module failed to import)"
+                    )
+                raise ValueError(
+                    f"Unknown LLM provider: {provider_name}. "
+                    f"Available providers: {_known_names(cls._llm_providers, 'llm')}"
+                )
+            cls.register_llm_provider(provider_name, provider_class)
         
-        provider_class = cls._llm_providers[provider_name]
-        instance = provider_class(**kwargs)
+        instance = _construct("llm", provider_name, provider_class, kwargs)
         
         logger.info(f"Created LLM provider: {provider_name}")
         return instance
@@ -86,17 +216,24 @@ class ServiceFactory:
         **kwargs
     ) -> EmbeddingsService:
         """Create an embeddings service instance."""
-        service_name = service_name or settings.embeddings_provider
+        service_name = service_name or cls._default_embeddings_provider
         
-        if service_name not in cls._embeddings_services:
-            available = list(cls._embeddings_services.keys())
-            raise ValueError(
-                f"Unknown embeddings service: {service_name}. "
-                f"Available services: {available}"
-            )
+        service_class = cls._embeddings_services.get(service_name)
+        if service_class is None:
+            service_class = _load_lazy("embeddings", service_name)
+            if service_class is None:
+                if service_name in _LAZY_REGISTRY["embeddings"]:
+                    raise ValueError(
+                        f"Embeddings service not available: {service_name} "
+                        f"(declared, but its module failed to import)"
+                    )
+                raise ValueError(
+                    f"Unknown embeddings service: {service_name}. "
+                    f"Available services: {_known_names(cls._embeddings_services, 'embeddings')}"
+                )
+            cls.register_embeddings_service(service_name, service_class)
         
-        service_class = cls._embeddings_services[service_name]
-        instance = service_class(**kwargs)
+        instance = _construct("embeddings", service_name, service_class, kwargs)
         
         logger.info(f"Created embeddings service: {service_name}")
         return instance
@@ -108,17 +245,24 @@ class ServiceFactory:
         **kwargs
     ) -> VectorStore:
         """Create a vector store instance."""
-        store_name = store_name or settings.vector_store_provider
+        store_name = store_name or cls._default_vector_store_provider
         
-        if store_name not in cls._vector_stores:
-            available = list(cls._vector_stores.keys())
-            raise ValueError(
-                f"Unknown vector store: {store_name}. "
-                f"Available stores: {available}"
-            )
+        store_class = cls._vector_stores.get(store_name)
+        if store_class is None:
+            store_class = _load_lazy("vector_store", store_name)
+            if store_class is None:
+                if store_name in _LAZY_REGISTRY["vector_store"]:
+                    raise ValueError(
+                        f"Vector store not available: {store_name} "
+                        f"(declared, but its module failed to import)"
+                    )
+                raise ValueError(
+                    f"Unknown vector store: {store_name}. "
+                    f"Available stores: {_known_names(cls._vector_stores, 'vector_store')}"
+                )
+            cls.register_vector_store(store_name, store_class)
         
-        store_class = cls._vector_stores[store_name]
-        instance = store_class(**kwargs)
+        instance = _construct("vector_store", store_name, store_class, kwargs)
         
         logger.info(f"Created vector store: {store_name}")
         return instance
@@ -132,12 +276,20 @@ class ServiceFactory:
         **kwargs
     ) -> RetrievalStrategy:
         """Create a retrieval strategy instance."""
-        if strategy_name not in cls._retrieval_strategies:
-            available = list(cls._retrieval_strategies.keys())
-            raise ValueError(
-                f"Unknown retrieval strategy: {strategy_name}. "
-                f"Available strategies: {available}"
-            )
+        strategy_class = cls._retrieval_strategies.get(strategy_name)
+        if strategy_class is None:
+            strategy_class = _load_lazy("retrieval_strategy", strategy_name)
+            if strategy_class is None:
+                if strategy_name in _LAZY_REGISTRY["retrieval_strategy"]:
+                    raise ValueError(
+                        f"Retrieval strategy not available: {strategy_name} "
+                        f"(declared, but its module failed to import)"
+                    )
+                raise ValueError(
+                    f"Unknown retrieval strategy: {strategy_name}. "
+                    f"Available strategies: {_known_names(cls._retrieval_strategies, 'retrieval_strategy')}"
+                )
+            cls.register_retrieval_strategy(strategy_name, strategy_class)
         
         # Create dependencies if not provided
         if vector_store is None:
@@ -145,7 +297,6 @@ class ServiceFactory:
         if embeddings_service is None:
             embeddings_service = cls.get_embeddings_service()
         
-        strategy_class = cls._retrieval_strategies[strategy_name]
         instance = strategy_class(
             vector_store=vector_store,
             embeddings_service=embeddings_service,
@@ -164,12 +315,20 @@ class ServiceFactory:
         **kwargs
     ) -> ChatService:
         """Create a chat service instance."""
-        if service_name not in cls._chat_services:
-            available = list(cls._chat_services.keys())
-            raise ValueError(
-                f"Unknown chat service: {service_name}. "
-                f"Available services: {available}"
-            )
+        service_class = cls._chat_services.get(service_name)
+        if service_class is None:
+            service_class = _load_lazy("chat_service", service_name)
+            if service_class is None:
+                if service_name in _LAZY_REGISTRY["chat_service"]:
+                    raise ValueError(
+                        f"Chat service not available: {service_name} "
+                        f"(declared, but its module failed to import)"
+                    )
+                raise ValueError(
+                    f"Unknown chat service: {service_name}. "
+                    f"Available services: {_known_names(cls._chat_services, 'chat_service')}"
+                )
+            cls.register_chat_service(service_name, service_class)
         
         # Create dependencies if not provided
         if llm_provider is None:
@@ -177,7 +336,6 @@ class ServiceFactory:
         if retrieval_strategy is None:
             retrieval_strategy = cls.get_retrieval_strategy()
         
-        service_class = cls._chat_services[service_name]
         instance = service_class(
             llm_provider=llm_provider,
             retrieval_strategy=retrieval_strategy,
@@ -190,141 +348,117 @@ class ServiceFactory:
     @classmethod
     def get_llm_provider(cls, provider_name: Optional[str] = None) -> LLMProvider:
         """Get or create singleton LLM provider instance."""
-        provider_name = provider_name or settings.llm_provider
-        cache_key = f"llm_provider_{provider_name}"
-        
-        if cache_key not in cls._instances:
-            cls._instances[cache_key] = cls.create_llm_provider(provider_name)
-        
-        return cls._instances[cache_key]
+        name = provider_name or cls._default_llm_provider
+        instance = cls._llm_instances.get(name)
+        if instance is None:
+            instance = cls._llm_instances[name] = cls.create_llm_provider(name)
+        return instance
     
     @classmethod
     def get_embeddings_service(cls, service_name: Optional[str] = None) -> EmbeddingsService:
         """Get or create singleton embeddings service instance."""
-        service_name = service_name or settings.embeddings_provider
-        cache_key = f"embeddings_service_{service_name}"
-        
-        if cache_key not in cls._instances:
-            cls._instances[cache_key] = cls.create_embeddings_service(service_name)
-        
-        return cls._instances[cache_key]
+        name = service_name or cls._default_embeddings_provider
+        instance = cls._embeddings_instances.get(name)
+        if instance is None:
+            instance = cls._embeddings_instances[name] = cls.create_embeddings_service(name)
+        return instance
     
     @classmethod
     def get_vector_store(cls, store_name: Optional[str] = None) -> VectorStore:
         """Get or create singleton vector store instance."""
-        store_name = store_name or settings.vector_store_provider
-        cache_key = f"vector_store_{store_name}"
-        
-        if cache_key not in cls._instances:
-            cls._instances[cache_key] = cls.create_vector_store(store_name)
-        
-        return cls._instances[cache_key]
+        name = store_name or cls._default_vector_store_provider
+        instance = cls._vector_store_instances.get(name)
+        if instance is None:
+            instance = cls._vector_store_instances[name] = cls.create_vector_store(name)
+        return instance
     
     @classmethod
     def get_retrieval_strategy(cls, strategy_name: str = "similarity") -> RetrievalStrategy:
         """Get or create singleton retrieval strategy instance."""
-        cache_key = f"retrieval_strategy_{strategy_name}"
-        
-        if cache_key not in cls._instances:
-            cls._instances[cache_key] = cls.create_retrieval_strategy(strategy_name)
-        
-        return cls._instances[cache_key]
+        instance = cls._retrieval_instances.get(strategy_name)
+        if instance is None:
+            instance = cls._retrieval_instances[strategy_name] = cls.create_retrieval_strategy(strategy_name)
+        return instance
     
     @classmethod
     def get_chat_service(cls, service_name: str = "default") -> ChatService:
         """Get or create singleton chat service instance."""
-        cache_key = f"chat_service_{service_name}"
-        
-        if cache_key not in cls._instances:
-            cls._instances[cache_key] = cls.create_chat_service(service_name)
-        
-        return cls._instances[cache_key]
+        instance = cls._chat_instances.get(service_name)
+        if instance is None:
+            instance = cls._chat_instances[service_name] = cls.create_chat_service(service_name)
+        return instance
+    
+    @classmethod
+    def refresh_defaults(cls) -> None:
+        """Re-read default provider names after a configuration reload."""
+        cls._default_llm_provider = settings.llm_provider
+        cls._default_embeddings_provider = settings.embeddings_provider
+        cls._default_vector_store_provider = settings.vector_store_provider
+        cls.clear_instances()
     
     @classmethod
     def clear_instances(cls) -> None:
         """Clear all cached instances."""
-        cls._instances.clear()
+        cls._llm_instances.clear()
+        cls._embeddings_instances.clear()
+        cls._vector_store_instances.clear()
+        cls._retrieval_instances.clear()
+        cls._chat_instances.clear()
+        cls._validation_result = None
+        cls._validation_expires_at = 0.0
         logger.info("Cleared all service instances")
     
     @classmethod
-    def get_available_providers(cls) -> Dict[str, list]:
-        """Get all available service providers."""
-        return {
-            "llm_providers": list(cls._llm_providers.keys()),
-            "embeddings_services": list(cls._embeddings_services.keys()),
-            "vector_stores": list(cls._vector_stores.keys()),
-            "retrieval_strategies": list(cls._retrieval_strategies.keys()),
-            "chat_services": list(cls._chat_services.keys()),
-        }
+    def get_available_providers(cls) -> Dict[str, tuple]:
+        """Get all available service providers (registered or declared)."""
+        cached = cls._available_cache
+        if cached is None:
+            cached = cls._available_cache = {
+                "llm_providers": tuple(_known_names(cls._llm_providers, "llm")),
+                "embeddings_services": tuple(_known_names(cls._embeddings_services, "embeddings")),
+                "vector_stores": tuple(_known_names(cls._vector_stores, "vector_store")),
+                "retrieval_strategies": tuple(_known_names(cls._retrieval_strategies, "retrieval_strategy")),
+                "chat_services": tuple(_known_names(cls._chat_services, "chat_service")),
+            }
+        return cached
     
     @classmethod
     async def validate_all_connections(cls) -> Dict[str, bool]:
-        """Validate connections for all configured services."""
-        results = {}
-        
-        try:
-            llm_provider = cls.get_llm_provider()
-            results["llm_provider"] = await llm_provider.validate_connection()
-        except Exception as e:
-            logger.error(f"Failed to validate LLM provider: {e}")
-            results["llm_provider"] = False
-        
-        try:
-            embeddings_service = cls.get_embeddings_service()
-            results["embeddings_service"] = await embeddings_service.validate_connection()
-        except Exception as e:
-            logger.error(f"Failed to validate embeddings service: {e}")
-            results["embeddings_service"] = False
-        
-        try:
-            vector_store = cls.get_vector_store()
-            results["vector_store"] = await vector_store.validate_connection()
-        except Exception as e:
-            logger.error(f"Failed to validate vector store: {e}")
-            results["vector_store"] = False
+        """Validate connections for all configured services.
+
+        Results are cached for a short TTL so frequent callers (e.g. the
+        /ready probe) don't trigger an external API round-trip per hit.
+        """
+        now = time.monotonic()
+        if cls._validation_result is not None and now < cls._validation_expires_at:
+            return cls._validation_result
         
+        results = await cls._validate_all_connections()
+        cls._validation_result = results
+        cls._validation_expires_at = time.monotonic() + cls._validation_ttl
         return results
-
-
-# Auto-register implementations when they're available
-def auto_register_services():
-    """Automatically register service implementations."""
-    try:
-        from .llm.openai_provider import OpenAIProvider
-        ServiceFactory.register_llm_provider("openai", OpenAIProvider)
-    except ImportError:
-        logger.debug("OpenAI provider not available")
     
-    try:
-        from .embeddings.openai_embeddings import OpenAIEmbeddings
-        ServiceFactory.register_embeddings_service("openai", OpenAIEmbeddings)
-    except ImportError:
-        logger.debug("OpenAI embeddings not available")
-    
-    try:
-        from .vectorstore.pinecone_store import PineconeStore
-        ServiceFactory.register_vector_store("pinecone", PineconeStore)
-    except ImportError:
-        logger.debug("Pinecone store not available")
-    
-    try:
-        from .vectorstore.chromadb_store import ChromaDBStore
-        ServiceFactory.register_vector_store("chromadb", ChromaDBStore)
-    except ImportError:
-        logger.debug("ChromaDB store not available")
-    
-    try:
-        from .retrieval.similarity_strategy import SimilarityStrategy
-        ServiceFactory.register_retrieval_strategy("similarity", SimilarityStrategy)
-    except ImportError:
-        logger.debug("Similarity strategy not available")
-    
-    try:
-        from .chat.default_chat_service import DefaultChatService
-        ServiceFactory.register_chat_service("default", DefaultChatService)
-    except ImportError:
-        logger.debug("Default chat service not available")
-
-
-# Register services on import
-auto_register_services()
+    @classmethod
+    async def _validate_all_connections(cls) -> Dict[str, bool]:
+        """Run the actual connection validations concurrently, uncached."""
+        async def validate(label: str, getter) -> bool:
+            try:
+                service = getter()
+                return bool(await service.validate_connection())
+            except Exception as e:
+                logger.error(f"Failed to validate {label}: {e}")
+                return False
+        
+        # Concurrent validations: total latency is the slowest round-trip,
+        # not the sum of all three
+        llm, embeddings, vector_store = await asyncio.gather(
+            validate("LLM provider", cls.get_llm_provider),
+            validate("embeddings service", cls.get_embeddings_service),
+            validate("vector store", cls.get_vector_store),
+        )
+        
+        return {
+            "llm_provider": llm,
+            "embeddings_service": embeddings,
+            "vector_store": vector_store,
+        }
@@ -4,24 +4,45 @@ OpenAI LLM provider implementation.
 This module provides OpenAI GPT integration following the LLMProvider interface.
 """
 
+import logging
 import time
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union, AsyncGenerator
 
-import openai
-import tiktoken
-from openai import AsyncOpenAI
-
 from ...core.config import settings
 from ...core.logging import get_logger, log_llm_request
 from ..base import LLMProvider, LLMResponse
 
 
+# Model -> tiktoken encoding name; all current chat models share cl100k_base
+_MODEL_ENCODING = {
+    "gpt-4": "cl100k_base",
+    "gpt-4-turbo-preview": "cl100k_base",
+    "gpt-3.5-turbo": "cl100k_base",
+    "gpt-3.5-turbo-16k": "cl100k_base",
+}
+_DEFAULT_ENCODING = "cl100k_base"
+
+
+@lru_cache(maxsize=4)
+def _load_encoding(encoding_name: str):
+    """Load a tiktoken encoding once per process.
+
+    BPE tables weigh several MB; sharing one object across all provider
+    instances avoids duplicate loads from tests and multi-tenant factories.
+    """
+    import tiktoken
+    return tiktoken.get_encoding(encoding_name)
+
+
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider implementation."""
     
     def __init__(self, api_key: Optional[str] = None, **kwargs):
         """Initialize OpenAI provider."""
         self.api_key = api_key or settings.openai.api_key
+        # Imported here so app startup doesn't pay for the openai package
+        from openai import AsyncOpenAI
         self.client = AsyncOpenAI(api_key=self.api_key)
         self.logger = get_logger(self.__class__.__name__)
         
@@ -38,6 +59,22 @@ class OpenAIProvider(LLMProvider):
             "gpt-3.5-turbo-16k": {"input": 0.003, "output": 0.004},
         }
         
+        # Per-token prices precomputed so the hot path does one dict lookup
+        # and two multiplies, no divisions
+        self._price_per_token = {
+            model: (p["input"] / 1000.0, p["output"] / 1000.0)
+            for model, p in self.token_pricing.items()
+        }
+        
+        # Maximum context length per model
+        self._context_lengths = {
+            "gpt-4": 8192,
+            "gpt-4-32k": 32768,
+            "gpt-4-turbo-preview": 128000,
+            "gpt-3.5-turbo": 4096,
+            "gpt-3.5-turbo-16k": 16384,
+        }
+        
         self.logger.info(f"Initialized OpenAI provider with model: {self.default_model}")
     
     async def generate_response(
@@ -54,7 +91,7 @@ class OpenAIProvider(LLMProvider):
         max_tokens = max_tokens or self.default_max_tokens
         temperature = temperature or self.default_temperature
         
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         
         try:
             # Prepare request parameters
@@ -67,50 +104,57 @@ class OpenAIProvider(LLMProvider):
             }
             
             if stream:
-                return self._stream_response(request_params, start_time)
+                return self._stream_response(request_params, start_ns)
             
             # Make API call
             response = await self.client.chat.completions.create(**request_params)
             
             # Calculate duration and cost
-            duration_ms = (time.time() - start_time) * 1000
-            usage = response.usage.dict() if response.usage else {}
-            cost = self._calculate_cost(model, usage)
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+            # Read token counts directly; a full .dict() serialization of the
+            # usage model is wasted work for three integers
+            usage_obj = response.usage
+            prompt_tokens = usage_obj.prompt_tokens if usage_obj else 0
+            completion_tokens = usage_obj.completion_tokens if usage_obj else 0
+            cost = self._calculate_cost(model, prompt_tokens, completion_tokens)
             
-            # Log the request
-            log_llm_request(
-                self.logger,
-                provider="openai",
-                model=model,
-                prompt_tokens=usage.get("prompt_tokens", 0),
-                completion_tokens=usage.get("completion_tokens", 0),
-                duration_ms=duration_ms,
-                cost=cost
-            )
+            # Log the request (skip the call entirely below INFO)
+            if self.logger.isEnabledFor(logging.INFO):
+                log_llm_request(
+                    self.logger,
+                    provider="openai",
+                    model=model,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=completion_tokens,
+                    duration_ms=duration_ms,
+                    cost=cost
+                )
             
             # Create response object
             llm_response = LLMResponse(
                 content=response.choices[0].message.content,
                 model=model,
-                usage=usage,
-                metadata={
-                    "finish_reason": response.choices[0].finish_reason,
-                    "cost_usd": cost,
-                    "duration_ms": duration_ms,
-                }
+                usage={
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+                finish_reason=response.choices[0].finish_reason,
+                cost_usd=cost,
+                duration_ms=duration_ms,
             )
             
             return llm_response
         
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             self.logger.error(f"OpenAI API error after {duration_ms:.2f}ms: {e}")
             raise
     
     async def _stream_response(
         self,
         request_params: Dict[str, Any],
-        start_time: float
+        start_ns: int
     ) -> AsyncGenerator[str, None]:
         """Stream response from OpenAI."""
         request_params["stream"] = True
@@ -119,39 +163,39 @@ class OpenAIProvider(LLMProvider):
             stream = await self.client.chat.completions.create(**request_params)
             
             async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+                choices = chunk.choices
+                if not choices:
+                    continue
+                content = choices[0].delta.content
+                if content:
+                    yield content
             
-            duration_ms = (time.time() - start_time) * 1000
-            self.logger.info(f"Streamed OpenAI response in {duration_ms:.2f}ms")
+            # Duration math only happens when the line will be emitted
+            if self.logger.isEnabledFor(logging.INFO):
+                duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+                self.logger.info(f"Streamed OpenAI response in {duration_ms:.2f}ms")
         
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             self.logger.error(f"OpenAI streaming error after {duration_ms:.2f}ms: {e}")
             raise
     
+    def _get_encoding(self, model: str):
+        """Get the process-global tiktoken encoding for a model."""
+        return _load_encoding(_MODEL_ENCODING.get(model, _DEFAULT_ENCODING))
+    
     async def count_tokens(self, text: str, model: Optional[str] = None) -> int:
         """Count tokens using tiktoken."""
         model = model or self.default_model
         
         try:
-            # Get encoding for the model
-            if model.startswith("gpt-4"):
-                encoding_name = "cl100k_base"
-            elif model.startswith("gpt-3.5"):
-                encoding_name = "cl100k_base"
-            else:
-                encoding_name = "cl100k_base"  # Default
-            
-            encoding = tiktoken.get_encoding(encoding_name)
-            tokens = encoding.encode(text)
-            
-            return len(tokens)
+            return len(self._get_encoding(model).encode(text))
         
         except Exception as e:
             self.logger.warning(f"Token counting error: {e}")
-            # Fallback to approximate count
-            return len(text.split()) * 1.3  # Rough approximation
+            # Approximate 4 characters per token; avoids the list allocation
+            # of text.split() and honors the declared int return type
+            return (len(text) >> 2) or 1
     
     def get_available_models(self) -> List[str]:
         """Get list of available OpenAI models."""
@@ -179,21 +223,19 @@ class OpenAIProvider(LLMProvider):
             self.logger.error(f"OpenAI connection validation failed: {e}")
             return False
     
-    def _calculate_cost(self, model: str, usage: Dict[str, int]) -> Optional[float]:
+    def _calculate_cost(
+        self,
+        model: str,
+        prompt_tokens: int,
+        completion_tokens: int
+    ) -> Optional[float]:
         """Calculate cost based on token usage."""
-        if model not in self.token_pricing:
+        prices = self._price_per_token.get(model)
+        if prices is None:
             return None
         
-        pricing = self.token_pricing[model]
-        prompt_tokens = usage.get("prompt_tokens", 0)
-        completion_tokens = usage.get("completion_tokens", 0)
-        
-        cost = (
-            (prompt_tokens / 1000) * pricing["input"] +
-            (completion_tokens / 1000) * pricing["output"]
-        )
-        
-        return cost
+        input_price, output_price = prices
+        return prompt_tokens * input_price + completion_tokens * output_price
     
     async def create_embedding(
         self,
@@ -218,16 +260,7 @@ class OpenAIProvider(LLMProvider):
     def get_context_length(self, model: Optional[str] = None) -> int:
         """Get maximum context length for model."""
         model = model or self.default_model
-        
-        context_lengths = {
-            "gpt-4": 8192,
-            "gpt-4-32k": 32768,
-            "gpt-4-turbo-preview": 128000,
-            "gpt-3.5-turbo": 4096,
-            "gpt-3.5-turbo-16k": 16384,
-        }
-        
-        return context_lengths.get(model, 4096)
+        return self._context_lengths.get(model, 4096)
     
     async def moderate_content(self, text: str) -> Dict[str, Any]:
         """Use OpenAI moderation API to check content."""
@@ -14,7 +14,7 @@ import pytest_asyncio
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 
-from app.core.config import Settings
+from app.core.config import Settings, get_settings
 from app.main import app
 from app.services.factory import ServiceFactory
 
@@ -27,6 +27,23 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
     loop.close()
 
 
+@pytest.fixture(scope="session", autouse=True)
+def default_test_env():
+    """Provide the required env vars once for the whole session."""
+    os.environ.setdefault("OPENAI_API_KEY", "test-key")
+    os.environ.setdefault("PINECONE_API_KEY", "test-key")
+    os.environ.setdefault("PINECONE_ENVIRONMENT", "test-env")
+    os.environ.setdefault("SECURITY_SECRET_KEY", "test-secret")
+
+
+@pytest.fixture
+def set_env(monkeypatch):
+    """Apply several environment variables in one os.environ swap."""
+    def _set(**values):
+        monkeypatch.setattr(os, "environ", {**os.environ, **values})
+    return _set
+
+
 @pytest.fixture
 def test_settings() -> Settings:
     """Create test settings with safe defaults."""
@@ -75,7 +92,7 @@ async def async_client() -> AsyncGenerator[AsyncClient, None]:
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_openai_provider():
     """Mock OpenAI provider for testing."""
     mock = AsyncMock()
@@ -91,7 +108,7 @@ def mock_openai_provider():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_openai_embeddings():
     """Mock OpenAI embeddings service for testing."""
     mock = AsyncMock()
@@ -112,7 +129,7 @@ def mock_openai_embeddings():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_vector_store():
     """Mock vector store for testing."""
     mock = AsyncMock()
@@ -127,7 +144,7 @@ def mock_vector_store():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_retrieval_strategy():
     """Mock retrieval strategy for testing."""
     mock = AsyncMock()
@@ -136,7 +153,7 @@ def mock_retrieval_strategy():
     return mock
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_chat_service():
     """Mock chat service for testing."""
     mock = AsyncMock()
@@ -151,6 +168,31 @@ def mock_chat_service():
     return mock
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(
+    mock_openai_provider,
+    mock_openai_embeddings,
+    mock_vector_store,
+    mock_retrieval_strategy,
+    mock_chat_service,
+):
+    """Reset shared session-scoped mocks after each test.
+
+    reset_mock() clears call records but keeps the configured return
+    values, so the session-scoped mocks stay interchangeable with the
+    old per-test ones.
+    """
+    yield
+    for mock in (
+        mock_openai_provider,
+        mock_openai_embeddings,
+        mock_vector_store,
+        mock_retrieval_strategy,
+        mock_chat_service,
+    ):
+        mock.reset_mock()
+
+
 @pytest.fixture(autouse=True)
 def clear_service_factory():
     """Clear ServiceFactory instances between tests."""
@@ -158,6 +200,14 @@ def clear_service_factory():
     ServiceFactory.clear_instances()
 
 
+@pytest.fixture(autouse=True)
+def clear_settings_cache():
+    """Drop memoized settings so env/YAML changes apply per test."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
 @pytest.fixture
 def sample_document_content():
     """Sample document content for testing."""